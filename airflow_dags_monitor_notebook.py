@@ -1,6 +1,4 @@
 import marimo
-import polars as pl
-import altair as alt
 
 __generated_with = "0.15.5"
 app = marimo.App(width="medium")
@@ -8,29 +6,69 @@ app = marimo.App(width="medium")
 
 @app.cell
 def _():
+    import functools
+    import logging
+    from concurrent.futures import ThreadPoolExecutor
+
+    import altair as alt
+    import polars as pl
+
+    # Keep chart data in-process as Arrow; VegaFusion only ships the transformed
+    # data to the browser instead of inlining every row as JSON
+    alt.data_transformers.enable("vegafusion")
+
+    # Show the monitor's progress messages as plain lines; other libraries
+    # (httpx logs every request at INFO) stay at the default WARNING level
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("dag_monitor_core").setLevel(logging.INFO)
+
     from dag_monitor_core import (
+        DAGMonitorError,
         validate_configuration,
-        AirflowClient,
+        AsyncAirflowClient,
         TaskDataFetcher,
         TaskAnalyzer,
+        TaskStatistics,
+        save_task_data,
     )
-    from config import DAG_ID, AIRFLOW_URL, TIME_PERIOD, TASK_STATES, SHOW_NO_SKIPPED_ONLY
+    from config import CONFIG
+
+    # Memoized on the (hashable, frozen) Config so reactive re-runs with an
+    # unchanged configuration skip validation
+    @functools.lru_cache(maxsize=32)
+    def validated_configuration(config):
+        return validate_configuration(
+            config.dag_id,
+            config.time_period,
+            config.task_states,
+        )
 
     return (
-        AIRFLOW_URL,
-        DAG_ID,
-        SHOW_NO_SKIPPED_ONLY,
-        AirflowClient,
+        AsyncAirflowClient,
+        CONFIG,
+        DAGMonitorError,
         TaskAnalyzer,
         TaskDataFetcher,
-        TIME_PERIOD,
-        TASK_STATES,
-        validate_configuration,
+        TaskStatistics,
+        ThreadPoolExecutor,
+        alt,
+        pl,
+        save_task_data,
+        validated_configuration,
     )
 
 
 @app.cell
-def _():
+def _(CONFIG, DAGMonitorError, validated_configuration):
+    try:
+        time_period, task_states = validated_configuration(CONFIG)
+    except ValueError as e:
+        raise DAGMonitorError(f"Invalid configuration: {e}") from e
+    return task_states, time_period
+
+
+@app.cell
+def _(alt):
     # Color scheme for charts - Catppuccin Mocha theme
     COLOR_SCHEME = {
         "success": "#a6e3a1",  # Green
@@ -41,28 +79,41 @@ def _():
         "up_for_retry": "#cba6f7",  # Purple
     }
 
-    def create_task_state_distribution_chart(df, width=500, height=300):
-        """Create a bar chart showing the distribution of task states."""
-        if df.is_empty():
+    # Shared by every chart, so build the scale and legend once
+    COLOR_SCALE = alt.Scale(
+        domain=list(COLOR_SCHEME.keys()), range=list(COLOR_SCHEME.values())
+    )
+    COLOR_LEGEND = alt.Legend(title="Task State")
+
+    # Columns the timeline chart needs from the task data
+    TIMELINE_COLUMNS = [
+        "dag_run_id",
+        "logical_date",
+        "task_id",
+        "task_state",
+        "duration",
+        "run_type",
+    ]
+
+    def create_task_state_distribution_chart(state_counts, width=500, height=300):
+        """Create a bar chart showing the distribution of task states.
+
+        Expects task states already aggregated into `task_state` and `count` columns.
+        The frame is handed over as Arrow, which VegaFusion reads without copying.
+        """
+        if state_counts.is_empty():
             return alt.Chart().mark_text(text="No data available", size=20)
 
-        # Aggregate task states
-        state_counts = df.group_by("task_state").agg(pl.len().alias("count"))
-
-        # Extract colors and domains from color scheme
-        domains = list(COLOR_SCHEME.keys())
-        ranges = list(COLOR_SCHEME.values())
-
         chart = (
-            alt.Chart(state_counts.to_pandas())
+            alt.Chart(state_counts.to_arrow())
             .mark_bar()
             .encode(
                 x=alt.X("task_state:N", title="Task State", sort="-y"),
                 y=alt.Y("count:Q", title="Number of Tasks"),
                 color=alt.Color(
                     "task_state:N",
-                    scale=alt.Scale(domain=domains, range=ranges),
-                    legend=alt.Legend(title="Task State"),
+                    scale=COLOR_SCALE,
+                    legend=COLOR_LEGEND,
                 ),
                 tooltip=["task_state:N", "count:Q"],
             )
@@ -71,37 +122,25 @@ def _():
 
         return chart
 
-    def create_dag_runs_timeline_chart(df, width=800, height=400):
-        """Create a timeline chart showing DAG runs and their task states over time."""
-        if df.is_empty():
-            return alt.Chart().mark_text(text="No data available", size=20)
+    def create_dag_runs_timeline_chart(chart_data, width=800, height=400):
+        """Create a timeline chart showing DAG runs and their task states over time.
 
-        # Convert to pandas for Altair
-        chart_data = df.select(
-            [
-                "dag_run_id",
-                "logical_date",
-                "task_id",
-                "task_state",
-                "duration",
-                "run_type",
-            ]
-        ).to_pandas()
-
-        # Extract colors and domains from color scheme
-        domains = list(COLOR_SCHEME.keys())
-        ranges = list(COLOR_SCHEME.values())
+        Expects task data already projected to TIMELINE_COLUMNS.
+        The frame is handed over as Arrow, which VegaFusion reads without copying.
+        """
+        if chart_data.is_empty():
+            return alt.Chart().mark_text(text="No data available", size=20)
 
         chart = (
-            alt.Chart(chart_data)
+            alt.Chart(chart_data.to_arrow())
             .mark_circle(size=100)
             .encode(
                 x=alt.X("logical_date:T", title="Logical Date"),
                 y=alt.Y("task_id:N", title="Task ID"),
                 color=alt.Color(
                     "task_state:N",
-                    scale=alt.Scale(domain=domains, range=ranges),
-                    legend=alt.Legend(title="Task State"),
+                    scale=COLOR_SCALE,
+                    legend=COLOR_LEGEND,
                 ),
                 size=alt.Size(
                     "duration:Q", title="Duration (s)", scale=alt.Scale(range=[50, 400])
@@ -123,17 +162,19 @@ def _():
 
         return chart
 
-    def display_statistics(stats):
-        """Display basic statistics in a formatted way."""
-        if not stats:
-            return None
+    def save_charts_as_html(charts, output_dir, prefix):
+        """Save each chart as `<prefix>_<name>.html` in output_dir and return the paths.
 
-        return {
-            "total_tasks": stats["total_tasks"],
-            "unique_dag_runs": stats["unique_dag_runs"],
-            "unique_task_types": stats["unique_task_types"],
-            "state_breakdown": stats["state_breakdown"],
-        }
+        chart.save writes the HTML to the file itself, so the spec is not kept
+        around as an extra Python string.
+        """
+        paths = []
+        for name, chart in charts.items():
+            path = f"{output_dir}/{prefix}_{name}.html"
+            chart.save(path, format="html", embed_options={"renderer": "canvas"})
+            paths.append(path)
+
+        return paths
 
     def display_no_skipped_analysis(no_skipped_df):
         """Display analysis of DAG runs with zero skipped tasks."""
@@ -144,77 +185,107 @@ def _():
 
     return (
         COLOR_SCHEME,
+        TIMELINE_COLUMNS,
         create_dag_runs_timeline_chart,
         create_task_state_distribution_chart,
         display_no_skipped_analysis,
-        display_statistics,
+        save_charts_as_html,
     )
 
 
 @app.cell
-def _(
-    AIRFLOW_URL,
-    AirflowClient,
-    DAG_ID,
-    SHOW_NO_SKIPPED_ONLY,
+async def _(
+    AsyncAirflowClient,
+    CONFIG,
+    DAGMonitorError,
     TaskAnalyzer,
     TaskDataFetcher,
-    TIME_PERIOD,
-    TASK_STATES,
+    TaskStatistics,
+    ThreadPoolExecutor,
+    TIMELINE_COLUMNS,
     create_dag_runs_timeline_chart,
     create_task_state_distribution_chart,
     display_no_skipped_analysis,
-    display_statistics,
-    sys,
-    validate_configuration,
+    pl,
+    save_charts_as_html,
+    save_task_data,
+    task_states,
+    time_period,
 ):
-    # Initialize variables outside try block
-    time_period = None
-    task_states = None
-
-    try:
-        time_period, task_states = validate_configuration(
-            DAG_ID, TIME_PERIOD, TASK_STATES
-        )
-    except ValueError as e:
-        sys.exit(1)
-
     # Initialize components
-    client = AirflowClient(AIRFLOW_URL)
-    fetcher = TaskDataFetcher(client)
+    client = AsyncAirflowClient(CONFIG.airflow_url)
+    fetcher = TaskDataFetcher(
+        client, cache_dir=f"{CONFIG.output_dir}/.cache" if CONFIG.cache_data else None
+    )
 
-    # Fetch task data
-    task_df = fetcher.fetch_task_data(DAG_ID, time_period, task_states)
+    # Fetch task data, issuing the API requests concurrently
+    task_df = await fetcher.fetch_task_data_async(
+        CONFIG.dag_id, time_period, task_states
+    )
 
     if task_df.is_empty():
-        sys.exit(1)
+        raise DAGMonitorError(
+            f"No task data found for DAG '{CONFIG.dag_id}' in the last {time_period.label}"
+        )
 
-    # Analyze data
+    if CONFIG.save_data:
+        save_task_data(
+            task_df, CONFIG.output_dir, CONFIG.dag_id, CONFIG.output_format
+        )
+
+    # Analyze data as a single lazy plan so Polars shares the scan across queries
     analyzer = TaskAnalyzer()
-    stats = analyzer.get_basic_statistics(task_df)
+    task_lf = task_df.lazy()
+    totals_lf, state_counts_lf = analyzer.get_basic_statistics_lazy(task_lf)
+    # The timeline only needs chart precision; the analysis keeps full precision
+    timeline_lf = task_lf.select(TIMELINE_COLUMNS).with_columns(
+        pl.col("duration").cast(pl.Float32),
+        pl.col("logical_date").cast(pl.Datetime("ms")),
+    )
+    queries = [totals_lf, state_counts_lf, timeline_lf]
+    if CONFIG.show_no_skipped_only:
+        queries.append(analyzer.find_runs_without_skipped_tasks_lazy(task_lf))
 
-    # Display basic statistics
-    stats_result = display_statistics(stats)
+    totals, state_counts, timeline, *no_skipped = pl.collect_all(queries)
+
+    stats = TaskStatistics.from_frames(totals, state_counts)
 
     # Analyze runs without skipped tasks if requested
     no_skipped_result = None
-    if SHOW_NO_SKIPPED_ONLY:
-        no_skipped_df = analyzer.find_runs_without_skipped_tasks(task_df)
-        no_skipped_result = display_no_skipped_analysis(no_skipped_df)
-
-    # Generate charts
-    charts = {
-        "task_state_distribution": create_task_state_distribution_chart(task_df),
-        "dag_runs_timeline": create_dag_runs_timeline_chart(task_df),
-    }
+    if CONFIG.show_no_skipped_only:
+        no_skipped_result = display_no_skipped_analysis(no_skipped[0])
+
+    # Generate charts concurrently; the Polars/Arrow work inside releases the GIL
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        distribution_chart = executor.submit(
+            create_task_state_distribution_chart, state_counts
+        )
+        timeline_chart = executor.submit(create_dag_runs_timeline_chart, timeline)
+        charts = {
+            "task_state_distribution": distribution_chart.result(),
+            "dag_runs_timeline": timeline_chart.result(),
+        }
+
+    chart_files = []
+    if CONFIG.save_charts:
+        chart_files = save_charts_as_html(charts, CONFIG.output_dir, CONFIG.dag_id)
 
     return {
         "task_df": task_df,
-        "stats": stats_result,
+        "stats": stats,
         "no_skipped_result": no_skipped_result,
         "charts": charts,
+        "chart_files": chart_files,
     }
 
 
 if __name__ == "__main__":
-    app.run()
+    import sys
+
+    from dag_monitor_core import DAGMonitorError
+
+    try:
+        app.run()
+    except DAGMonitorError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
@@ -2,91 +2,134 @@
 """
 Configuration file for Airflow DAG Task Monitor
 
-Edit the variables below to customize the analysis parameters.
+Edit the defaults in the Config class below to customize the analysis parameters.
 """
 
-# ============================================================================
-# AIRFLOW CONFIGURATION
-# ============================================================================
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Tuple, Union
+
+from dag_monitor_core import TaskState
 
-# DAG ID to monitor (REQUIRED)
-DAG_ID = "mimecast_mta_to_datadog_etl_test"
 
-# Airflow webserver URL
-AIRFLOW_URL = "http://localhost:8080"
-
-# ============================================================================
-# ANALYSIS PARAMETERS
-# ============================================================================
-
-# Time period for analysis
-# Options: 5m, 15m, 30m, 1h, 6h, 12h, 1d, 2d, 7d, 14d, 1mo
-TIME_PERIOD = "1h"
-
-# Task states to include in analysis
-# Set to None to include all states, or specify a list like ["success", "failed"]
-# Available states: success, failed, skipped, running, queued, up_for_retry, 
-#                   up_for_reschedule, upstream_failed, deferred, removed
-TASK_STATES = None
-
-# Show only DAG runs with zero skipped tasks
-SHOW_NO_SKIPPED_ONLY = True
-
-# ============================================================================
-# OUTPUT CONFIGURATION
-# ============================================================================
-
-# Save task data to CSV file
-SAVE_DATA = False
-
-# Save charts as HTML files
-SAVE_CHARTS = True
-
-# Output directory for saved files (charts and CSV)
-OUTPUT_DIR = "/tmp"
-
-# ============================================================================
-# CHART CONFIGURATION
-# ============================================================================
-
-# Chart dimensions and styling
-CHART_WIDTH = 800
-CHART_HEIGHT = 400
-SMALL_CHART_WIDTH = 500
-SMALL_CHART_HEIGHT = 300
-
-# Color scheme for task states
-TASK_STATE_COLORS = {
-    "success": "#2E7D32",        # Green
-    "failed": "#D32F2F",         # Red
-    "skipped": "#FF9800",        # Orange
-    "running": "#1976D2",        # Blue
-    "queued": "#757575",         # Gray
-    "up_for_retry": "#9C27B0"    # Purple
-}
-
-# ============================================================================
-# API CONFIGURATION
-# ============================================================================
-
-# Maximum number of DAG runs to fetch per API call
-MAX_DAG_RUNS_LIMIT = 100
-
-# Request timeout in seconds
-REQUEST_TIMEOUT = 30
-
-# Retry configuration for API calls
-MAX_RETRIES = 3
-RETRY_DELAY = 1.0  # seconds
-
-# ============================================================================
-# DISPLAY CONFIGURATION
-# ============================================================================
-
-# Console output formatting
-CONSOLE_WIDTH = 60
-ENABLE_EMOJI = True
-VERBOSE_OUTPUT = True
-
-# Date/time formatting for display
-DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
\ No newline at end of file
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Monitor settings. Frozen and slotted, so instances are immutable, cheap to
+    read from and hashable (usable as a functools.lru_cache key).
+    """
+
+    # ========================================================================
+    # AIRFLOW CONFIGURATION
+    # ========================================================================
+
+    # DAG ID to monitor (REQUIRED)
+    dag_id: str = "mimecast_mta_to_datadog_etl_test"
+
+    # Airflow webserver URL
+    airflow_url: str = "http://localhost:8080"
+
+    # ========================================================================
+    # ANALYSIS PARAMETERS
+    # ========================================================================
+
+    # Time period for analysis
+    # Options: 5m, 15m, 30m, 1h, 6h, 12h, 1d, 2d, 7d, 14d, 1mo
+    time_period: str = "1h"
+
+    # Task states to include in analysis
+    # Set to None to include all states, or specify a tuple like ("success", "failed")
+    # Available states: success, failed, skipped, running, queued, up_for_retry,
+    #                   up_for_reschedule, upstream_failed, deferred, removed,
+    #                   scheduled, restarting
+    # Normalized to a frozenset of TaskState members on construction
+    task_states: Optional[Union[Tuple[str, ...], FrozenSet[TaskState]]] = None
+
+    # Show only DAG runs with zero skipped tasks
+    show_no_skipped_only: bool = True
+
+    # ========================================================================
+    # OUTPUT CONFIGURATION
+    # ========================================================================
+
+    # Save task data to a file in output_dir
+    save_data: bool = False
+
+    # File format for saved task data
+    # Options: csv, csv.zst (zstd-compressed CSV),
+    #          parquet (zstd-compressed, several times smaller and faster to write)
+    output_format: str = "parquet"
+
+    # Save charts as HTML files
+    save_charts: bool = True
+
+    # Output directory for saved files (charts and task data)
+    output_dir: str = "/tmp"
+
+    # Cache fetched task data as Parquet under output_dir/.cache
+    # Repeated runs with the same DAG, time period and states skip the API calls
+    cache_data: bool = True
+
+    # ========================================================================
+    # CHART CONFIGURATION
+    # ========================================================================
+
+    # Chart dimensions and styling
+    chart_width: int = 800
+    chart_height: int = 400
+    small_chart_width: int = 500
+    small_chart_height: int = 300
+
+    # Color scheme for task states (read-only; excluded from the hash)
+    task_state_colors: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType({
+            "success": "#2E7D32",        # Green
+            "failed": "#D32F2F",         # Red
+            "skipped": "#FF9800",        # Orange
+            "running": "#1976D2",        # Blue
+            "queued": "#757575",         # Gray
+            "up_for_retry": "#9C27B0"    # Purple
+        }),
+        hash=False
+    )
+
+    # ========================================================================
+    # API CONFIGURATION
+    # ========================================================================
+
+    # Maximum number of DAG runs to fetch per API call
+    max_dag_runs_limit: int = 100
+
+    # Request timeout in seconds
+    request_timeout: int = 30
+
+    # Retry configuration for API calls
+    max_retries: int = 3
+    retry_delay: float = 1.0  # seconds
+
+    # ========================================================================
+    # DISPLAY CONFIGURATION
+    # ========================================================================
+
+    # Console output formatting
+    console_width: int = 60
+    enable_emoji: bool = True
+    verbose_output: bool = True
+
+    # Date/time formatting for display
+    datetime_format: str = "%Y-%m-%d %H:%M:%S"
+
+    def __post_init__(self):
+        # Convert task_states to TaskState members once, here, so validation
+        # and filtering work on a hashable frozenset. If a name is unknown the
+        # states are kept as a tuple, still hashable, for validate_configuration
+        # to report.
+        if self.task_states is not None and not isinstance(self.task_states, frozenset):
+            try:
+                task_states = frozenset(TaskState(state) for state in self.task_states)
+            except ValueError:
+                task_states = tuple(self.task_states)
+            object.__setattr__(self, "task_states", task_states)
+
+
+CONFIG = Config()
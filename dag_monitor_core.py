@@ -6,12 +6,40 @@ Contains all classes and utility functions for monitoring and analyzing
 Airflow DAG task statuses.
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import inspect
+import logging
+import os
 import sys
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Collection, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, TypeVar, Union
+import httpx
+import msgspec
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import polars as pl
+import zstandard
+
+
+# Progress and error messages; the console reports below write to stdout
+logger = logging.getLogger(__name__)
+
+# Page type for AirflowClient._get_pages
+T = TypeVar("T")
+
+# Section separator for console reports
+_SEP = "=" * 60
+
+
+class DAGMonitorError(RuntimeError):
+    """Raised when the monitor cannot produce results, e.g. invalid configuration or no data"""
 
 
 class TaskState(Enum):
@@ -26,6 +54,18 @@ class TaskState(Enum):
     UPSTREAM_FAILED = "upstream_failed"
     DEFERRED = "deferred"
     REMOVED = "removed"
+    SCHEDULED = "scheduled"
+    RESTARTING = "restarting"
+
+
+# Polars dtype for the task_state column; states are a small closed set, so an
+# Enum stores them as integer codes instead of strings
+TASK_STATE_DTYPE = pl.Enum([state.value for state in TaskState])
+
+
+def state_bit(state: TaskState) -> int:
+    """Bit representing a task state in a state mask, keyed by its Enum code."""
+    return 1 << list(TaskState).index(state)
 
 
 class TimePeriod(Enum):
@@ -47,72 +87,548 @@ class TimePeriod(Enum):
         self.delta = delta
 
 
+# Lookups for validate_configuration
+_PERIODS_BY_LABEL = {period.label: period for period in TimePeriod}
+_VALID_STATE_VALUES = frozenset(state.value for state in TaskState)
+
+
+class DagRun(msgspec.Struct):
+    """A DAG run as returned by the Airflow REST API (only the fields used here)."""
+    dag_run_id: str
+    run_type: str
+    state: str
+    logical_date: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+
+class DagRunsResponse(msgspec.Struct):
+    """Response body of the DAG runs endpoint."""
+    dag_runs: List[DagRun] = []
+    total_entries: int = 0
+
+
+class TaskInstance(msgspec.Struct):
+    """A task instance as returned by the Airflow REST API (only the fields used here)."""
+    task_id: str
+    dag_run_id: str = ""
+    state: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    duration: Optional[float] = 0.0
+    try_number: int = 0
+    max_tries: int = 0
+    operator: Optional[str] = ""
+    priority_weight: Optional[int] = 0
+
+
+class TaskInstancesResponse(msgspec.Struct):
+    """Response body of the task instances endpoint."""
+    task_instances: List[TaskInstance] = []
+    total_entries: int = 0
+
+
+# Decode response bodies straight into the Structs above; unknown fields are skipped
+_DAG_RUNS_DECODER = msgspec.json.Decoder(DagRunsResponse)
+_TASK_INSTANCES_DECODER = msgspec.json.Decoder(TaskInstancesResponse)
+
+# Ask the API for only the fields DagRun declares; the task instances batch
+# list endpoint has no field projection, so its responses come back in full
+_DAG_RUN_FIELDS = ",".join(DagRun.__struct_fields__)
+
+
+def _dag_runs_params(start_date_gte: str, limit: int) -> Dict[str, Any]:
+    """Query parameters for the DAG runs endpoint, without the page offset."""
+    return {
+        "start_date_gte": start_date_gte,
+        "limit": limit,
+        "order_by": "-start_date",
+        "fields": _DAG_RUN_FIELDS
+    }
+
+
+def _task_instances_batch_body(
+    dag_id: str,
+    dag_run_ids: List[str],
+    states: Optional[List[str]],
+    page_limit: int
+) -> Dict[str, Any]:
+    """Request body for the task instances batch list endpoint, without the page offset."""
+    body: Dict[str, Any] = {"dag_ids": [dag_id], "dag_run_ids": dag_run_ids, "page_limit": page_limit}
+    if states:
+        body["state"] = states
+    return body
+
+
+def _page_offsets(page_size: int, total_entries: int) -> range:
+    """
+    Offsets of the pages after the first one, for a paged listing of total_entries items.
+    
+    page_size is the number of items the server returned on the first page,
+    not the number requested: Airflow caps page sizes at its
+    api.maximum_page_limit setting.
+    """
+    if page_size == 0:
+        if total_entries > 0:
+            raise DAGMonitorError(f"The Airflow API returned an empty first page of {total_entries} entries")
+        return range(0)
+    return range(page_size, total_entries, page_size)
+
+
+def _check_total(kind: str, count: int, total_entries: int) -> None:
+    """Raise DAGMonitorError when a paged listing did not return total_entries items."""
+    if count != total_entries:
+        raise DAGMonitorError(
+            f"Fetched {count} of {total_entries} {kind}; the listing changed while it was paged, try again"
+        )
+
+
+def _merge_dag_runs(first_page: DagRunsResponse, pages: Iterable[DagRunsResponse]) -> DagRunsResponse:
+    """Join the pages of a DAG runs listing into one response, checking it is complete."""
+    dag_runs = first_page.dag_runs
+    for page in pages:
+        dag_runs.extend(page.dag_runs)
+    _check_total("DAG runs", len(dag_runs), first_page.total_entries)
+    return DagRunsResponse(dag_runs=dag_runs, total_entries=first_page.total_entries)
+
+
+def _merge_task_instances(
+    first_page: TaskInstancesResponse,
+    pages: Iterable[TaskInstancesResponse]
+) -> TaskInstancesResponse:
+    """Join the pages of a task instances listing into one response, checking it is complete."""
+    task_instances = first_page.task_instances
+    for page in pages:
+        task_instances.extend(page.task_instances)
+    _check_total("task instances", len(task_instances), first_page.total_entries)
+    return TaskInstancesResponse(task_instances=task_instances, total_entries=first_page.total_entries)
+
+
+@contextlib.contextmanager
+def _task_instance_errors(run_count: int):
+    """Re-raise request and decode errors from fetching task instances as DAGMonitorError."""
+    try:
+        yield
+    except (requests.RequestException, httpx.HTTPError, msgspec.DecodeError) as e:
+        raise DAGMonitorError(f"Error fetching task instances for {run_count} DAG runs: {e}") from e
+
+
 class AirflowClient:
     """
     Client for interacting with Airflow REST API.
     Handles authentication and API calls to fetch DAG runs and task instances.
     """
     
-    def __init__(self, base_url: str = "http://localhost:8080", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        timeout: int = 30,
+        pool_size: int = 32,
+        max_retries: int = 3
+    ):
         """
         Initialize the Airflow API client.
         
         Args:
             base_url: Base URL for the Airflow webserver
             timeout: Request timeout in seconds
+            pool_size: Connections kept open per host; at least the number of
+                threads sharing this client so none waits for a connection
+            max_retries: Retries, with backoff, for failed connections and reads
         """
         self.base_url = base_url
         self.timeout = timeout
+        self.pool_size = pool_size
         self.session = requests.Session()
         self.session.headers.update({"accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            # POST is retried too: the task instances batch list endpoint is read-only
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=0.2,
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"}
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def _get_pages(self, get_page: Callable[[int], T], offsets: Iterable[int]) -> List[T]:
+        """Fetch the pages at offsets concurrently, one thread per pooled connection."""
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return list(executor.map(get_page, offsets))
     
-    def get_dag_runs(self, dag_id: str, start_date_gte: str, limit: int = 100) -> Dict[str, Any]:
+    def get_dag_runs(self, dag_id: str, start_date_gte: str, limit: int = 100) -> DagRunsResponse:
         """
-        Fetch DAG runs for a specific DAG within a time range.
+        Fetch all DAG runs for a specific DAG within a time range.
+        
+        The first page reports the total number of runs; the remaining pages
+        are then requested concurrently, one thread per pooled connection.
         
         Args:
             dag_id: The DAG identifier
             start_date_gte: Start date filter in ISO format
-            limit: Maximum number of runs to fetch
+            limit: Number of runs to request per page; the server may return fewer
             
         Returns:
-            Dictionary containing DAG runs data
+            DagRunsResponse with the DAG runs, empty if a request fails
+            
+        Raises:
+            DAGMonitorError: If the pages do not add up to the reported total
         """
         url = f"{self.base_url}/api/v2/dags/{dag_id}/dagRuns"
-        params = {
-            "start_date_gte": start_date_gte,
-            "limit": limit,
-            "order_by": "-start_date"
-        }
+        params = _dag_runs_params(start_date_gte, limit)
+        
+        def get_page(offset: int) -> DagRunsResponse:
+            response = self.session.get(url, params={**params, "offset": offset}, timeout=self.timeout)
+            response.raise_for_status()
+            return _DAG_RUNS_DECODER.decode(response.content)
         
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            first_page = get_page(0)
+            pages = self._get_pages(get_page, _page_offsets(len(first_page.dag_runs), first_page.total_entries))
+        except (requests.RequestException, msgspec.DecodeError) as e:
+            logger.error("❌ Error fetching DAG runs: %s", e)
+            return DagRunsResponse()
+        
+        return _merge_dag_runs(first_page, pages)
+    
+    def list_task_instances(
+        self,
+        dag_id: str,
+        dag_run_ids: List[str],
+        states: Optional[List[str]] = None,
+        page_limit: int = 100
+    ) -> TaskInstancesResponse:
+        """
+        Fetch the task instances of many DAG runs through the batch list endpoint.
+        
+        The first page reports the total number of task instances; the remaining
+        pages are then requested concurrently, one thread per pooled connection.
+        
+        Args:
+            dag_id: The DAG identifier
+            dag_run_ids: The DAG runs to fetch task instances for
+            states: Task states to return, or None for all
+            page_limit: Number of task instances to request per page; the
+                server may return fewer
+            
+        Returns:
+            TaskInstancesResponse with the task instances of all the runs
+            
+        Raises:
+            requests.RequestException: If any page cannot be fetched
+            msgspec.DecodeError: If any page cannot be decoded
+            DAGMonitorError: If the pages do not add up to the reported total
+        """
+        url = f"{self.base_url}/api/v2/dags/~/dagRuns/~/taskInstances/list"
+        body = _task_instances_batch_body(dag_id, dag_run_ids, states, page_limit)
+        
+        def get_page(offset: int) -> TaskInstancesResponse:
+            response = self.session.post(url, json={**body, "page_offset": offset}, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"❌ Error fetching DAG runs: {e}")
-            return {"dag_runs": []}
+            return _TASK_INSTANCES_DECODER.decode(response.content)
+        
+        # Errors are not caught here: one failed page covers many runs, so the
+        # caller must not mistake the rest for a complete result
+        first_page = get_page(0)
+        pages = self._get_pages(get_page, _page_offsets(len(first_page.task_instances), first_page.total_entries))
+        return _merge_task_instances(first_page, pages)
+
+
+class AsyncAirflowClient:
+    """
+    Asynchronous client for the Airflow REST API built on httpx.
+    Issues paginated requests concurrently over one connection pool.
+    
+    Use as an async context manager; the HTTP session is open inside the block.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        timeout: int = 30,
+        max_connections: int = 64,
+        max_in_flight: int = 32,
+        keepalive_expiry: float = 30.0,
+        max_retries: int = 3
+    ):
+        """
+        Initialize the async Airflow API client.
+        
+        Args:
+            base_url: Base URL for the Airflow webserver
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of pooled connections
+            max_in_flight: Maximum number of requests awaiting a response at
+                once, so a large gather does not flood the Airflow webserver
+            keepalive_expiry: Seconds an idle connection is kept for reuse
+            max_retries: Retries for failed connection attempts
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        self.keepalive_expiry = keepalive_expiry
+        self.max_retries = max_retries
+        self.session: Optional[httpx.AsyncClient] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+    
+    async def __aenter__(self) -> "AsyncAirflowClient":
+        self.session = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={"accept": "application/json"},
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=self.max_retries)
+        )
+        # Created here so it belongs to the event loop running the session
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.aclose()
+        self.session = None
+        self._in_flight = None
+    
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL on the session, waiting for a free in-flight slot first."""
+        async with self._in_flight:
+            response = await self.session.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        """POST to a URL on the session, waiting for a free in-flight slot first."""
+        async with self._in_flight:
+            response = await self.session.post(url, **kwargs)
+        response.raise_for_status()
+        return response
     
-    def get_task_instances(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
+    async def get_dag_runs(self, dag_id: str, start_date_gte: str, limit: int = 100) -> DagRunsResponse:
         """
-        Fetch task instances for a specific DAG run.
+        Fetch all DAG runs for a specific DAG within a time range.
+        
+        The first page reports the total number of runs; the remaining pages
+        are then requested concurrently.
         
         Args:
-            dag_id: The DAG identifier  
-            dag_run_id: The DAG run identifier
+            dag_id: The DAG identifier
+            start_date_gte: Start date filter in ISO format
+            limit: Number of runs to request per page; the server may return fewer
             
         Returns:
-            Dictionary containing task instances data
+            DagRunsResponse with the DAG runs, empty if a request fails
+            
+        Raises:
+            DAGMonitorError: If the pages do not add up to the reported total
         """
-        url = f"{self.base_url}/api/v2/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances"
+        url = f"/api/v2/dags/{dag_id}/dagRuns"
+        params = _dag_runs_params(start_date_gte, limit)
+        
+        async def get_page(offset: int) -> DagRunsResponse:
+            response = await self._get(url, params={**params, "offset": offset})
+            return _DAG_RUNS_DECODER.decode(response.content)
         
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"❌ Error fetching task instances for {dag_run_id}: {e}")
-            return {"task_instances": []}
+            first_page = await get_page(0)
+            pages = await asyncio.gather(*map(get_page, _page_offsets(len(first_page.dag_runs), first_page.total_entries)))
+        except (httpx.HTTPError, msgspec.DecodeError) as e:
+            logger.error("❌ Error fetching DAG runs: %s", e)
+            return DagRunsResponse()
+        
+        return _merge_dag_runs(first_page, pages)
+    
+    async def list_task_instances(
+        self,
+        dag_id: str,
+        dag_run_ids: List[str],
+        states: Optional[List[str]] = None,
+        page_limit: int = 100
+    ) -> TaskInstancesResponse:
+        """
+        Fetch the task instances of many DAG runs through the batch list endpoint.
+        
+        The first page reports the total number of task instances; the remaining
+        pages are then requested concurrently.
+        
+        Args:
+            dag_id: The DAG identifier
+            dag_run_ids: The DAG runs to fetch task instances for
+            states: Task states to return, or None for all
+            page_limit: Number of task instances to request per page; the
+                server may return fewer
+            
+        Returns:
+            TaskInstancesResponse with the task instances of all the runs
+            
+        Raises:
+            httpx.HTTPError: If any page cannot be fetched
+            msgspec.DecodeError: If any page cannot be decoded
+            DAGMonitorError: If the pages do not add up to the reported total
+        """
+        url = "/api/v2/dags/~/dagRuns/~/taskInstances/list"
+        body = _task_instances_batch_body(dag_id, dag_run_ids, states, page_limit)
+        
+        async def get_page(offset: int) -> TaskInstancesResponse:
+            response = await self._post(url, json={**body, "page_offset": offset})
+            return _TASK_INSTANCES_DECODER.decode(response.content)
+        
+        # Errors are not caught here: one failed page covers many runs, so the
+        # caller must not mistake the rest for a complete result
+        first_page = await get_page(0)
+        pages = await asyncio.gather(*map(get_page, _page_offsets(len(first_page.task_instances), first_page.total_entries)))
+        return _merge_task_instances(first_page, pages)
+
+
+def _cache_ttl(time_period: TimePeriod) -> float:
+    """
+    Seconds a cached fetch stays fresh: a minute for short windows, growing
+    with the window length up to an hour for historical ones.
+    """
+    return min(max(time_period.delta.total_seconds() / 60, 60.0), 3600.0)
+
+
+def _cache_path(
+    cache_dir: str,
+    base_url: str,
+    dag_id: str,
+    time_period: TimePeriod,
+    task_states: Collection[TaskState]
+) -> str:
+    """Parquet cache file for a (server, dag_id, time period, task states) fetch."""
+    states = sorted(state.value for state in task_states or ())
+    key = hashlib.blake2b(f"{base_url}|{dag_id}|{time_period.label}|{states}".encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{key}.parquet")
+
+
+def _read_cache(path: str, time_period: TimePeriod) -> Optional[pl.DataFrame]:
+    """Return the cached frame at path if it exists and is still fresh."""
+    try:
+        if time.time() - os.path.getmtime(path) < _cache_ttl(time_period):
+            df = pl.read_parquet(path, memory_map=True)
+            logger.info("✅ Loaded %d task instances from cache", len(df))
+            return df
+    except OSError:
+        pass
+    return None
+
+
+def _write_cache(path: Optional[str], df: pl.DataFrame) -> None:
+    """Store a non-empty fetch result at path; nothing is stored when path is None."""
+    if path is None or df.is_empty():
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    df.write_parquet(tmp_path, compression="zstd")
+    os.replace(tmp_path, path)
+
+
+# DAG run states after which a run's task instances no longer change
+_TERMINAL_RUN_STATES = frozenset({"success", "failed"})
+
+# Cached task instances of finished DAG runs are dropped after a week
+_RUN_CACHE_MAX_AGE = 7 * 24 * 3600.0
+
+
+def _run_cache_path(cache_dir: str, base_url: str, dag_id: str, dag_run: DagRun) -> str:
+    """JSON cache file for the task instances of a finished DAG run on a server."""
+    # end_date is part of the key, so a cleared and re-run DAG run is fetched again
+    key = hashlib.blake2b(f"{base_url}|{dag_id}|{dag_run.dag_run_id}|{dag_run.end_date}".encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, "runs", f"{key}.json")
+
+
+def _read_run_cache(path: str) -> Optional[TaskInstancesResponse]:
+    """Return the task instances cached at path, if any."""
+    try:
+        with open(path, "rb") as f:
+            return _TASK_INSTANCES_DECODER.decode(f.read())
+    except (OSError, msgspec.DecodeError):
+        return None
+
+
+def _write_run_cache(path: str, response: TaskInstancesResponse) -> None:
+    """Store a non-empty task instances response at path."""
+    if not response.task_instances:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(msgspec.json.encode(response))
+    os.replace(tmp_path, path)
+
+
+def _prune_run_cache(cache_dir: str) -> None:
+    """Remove cached task instances older than _RUN_CACHE_MAX_AGE."""
+    cutoff = time.time() - _RUN_CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(os.path.join(cache_dir, "runs")))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _cache_lookup(
+    fetcher: "TaskDataFetcher",
+    dag_id: str,
+    time_period: TimePeriod,
+    task_states: Collection[TaskState]
+) -> Tuple[Optional[str], Optional[pl.DataFrame]]:
+    """
+    Find the Parquet cache entry for a fetch.
+    
+    Returns:
+        Tuple of (cache path, or None when caching is disabled; cached frame,
+        or None when there is no fresh entry)
+    """
+    if fetcher.cache_dir is None:
+        return None, None
+    path = _cache_path(fetcher.cache_dir, fetcher.client.base_url, dag_id, time_period, task_states)
+    return path, _read_cache(path, time_period)
+
+
+def cache_to_parquet(fetch):
+    """
+    Memoize a TaskDataFetcher fetch method on disk as Parquet.
+    
+    Results are keyed by (client base URL, dag_id, time period, task states) and
+    stored under the fetcher's cache_dir; caching is skipped when cache_dir is
+    None. Works for both regular and async fetch methods.
+    
+    Only results of fetches that completed are stored: a fetch that hits a
+    request error raises before anything is written, and the empty frame
+    returned when no DAG runs could be listed is never cached.
+    """
+    if inspect.iscoroutinefunction(fetch):
+        @functools.wraps(fetch)
+        async def async_wrapper(self, dag_id: str, time_period: TimePeriod, task_states: Collection[TaskState]) -> pl.DataFrame:
+            path, df = _cache_lookup(self, dag_id, time_period, task_states)
+            if df is None:
+                df = await fetch(self, dag_id, time_period, task_states)
+                _write_cache(path, df)
+            return df
+        
+        return async_wrapper
+    
+    @functools.wraps(fetch)
+    def wrapper(self, dag_id: str, time_period: TimePeriod, task_states: Collection[TaskState]) -> pl.DataFrame:
+        path, df = _cache_lookup(self, dag_id, time_period, task_states)
+        if df is None:
+            df = fetch(self, dag_id, time_period, task_states)
+            _write_cache(path, df)
+        return df
+    
+    return wrapper
 
 
 class TaskDataFetcher:
@@ -121,20 +637,125 @@ class TaskDataFetcher:
     Converts raw API responses into structured Polars DataFrames.
     """
     
-    def __init__(self, client: AirflowClient):
+    def __init__(
+        self,
+        client: Union[AirflowClient, AsyncAirflowClient],
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize with an Airflow client.
         
         Args:
-            client: AirflowClient instance for API communication
+            client: AirflowClient for fetch_task_data, or AsyncAirflowClient
+                for fetch_task_data_async
+            cache_dir: Directory for cached fetch results and for the task
+                instances of finished DAG runs, or None to disable caching
         """
         self.client = client
+        self.cache_dir = cache_dir
+        # Old run cache entries are removed on the first fetch, not here, so
+        # constructing a fetcher does no file I/O
+        self._run_cache_pruned = False
+    
+    @staticmethod
+    def _start_date(time_period: TimePeriod) -> str:
+        """
+        Compute the ISO start of the analysis window ending now.
+        
+        Args:
+            time_period: Time period for data collection
+            
+        Returns:
+            Start date string in ISO format
+        """
+        iso_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - time_period.delta
+        start_date_str = start_time.strftime(iso_format)
+        
+        logger.info("📊 Fetching DAG runs from %s to %s", start_date_str, end_time.strftime(iso_format))
+        return start_date_str
+    
+    def _cached_task_instances(self, dag_id: str, dag_run: DagRun) -> Optional[TaskInstancesResponse]:
+        """Return stored task instances for a finished DAG run, if any."""
+        if self.cache_dir is None or dag_run.state not in _TERMINAL_RUN_STATES:
+            return None
+        return _read_run_cache(_run_cache_path(self.cache_dir, self.client.base_url, dag_id, dag_run))
+    
+    def _cached_runs(
+        self,
+        dag_id: str,
+        dag_runs: List[DagRun]
+    ) -> Tuple[Dict[str, TaskInstancesResponse], List[str]]:
+        """
+        Split dag_runs into runs with stored task instances and runs to fetch.
+        
+        The first call also removes run cache entries older than _RUN_CACHE_MAX_AGE.
+        
+        Returns:
+            Tuple of (stored task instances by dag_run_id, dag_run_ids of the
+            runs whose task instances must be fetched)
+        """
+        if self.cache_dir is not None and not self._run_cache_pruned:
+            _prune_run_cache(self.cache_dir)
+            self._run_cache_pruned = True
+        
+        cached = {}
+        missing = []
+        for dag_run in dag_runs:
+            response = self._cached_task_instances(dag_id, dag_run)
+            if response is not None:
+                cached[dag_run.dag_run_id] = response
+            else:
+                missing.append(dag_run.dag_run_id)
+        return cached, missing
     
+    def _store_task_instances(self, dag_id: str, dag_run: DagRun, response: TaskInstancesResponse) -> None:
+        """Store the task instances of a finished DAG run for later fetches."""
+        if self.cache_dir is not None and dag_run.state in _TERMINAL_RUN_STATES:
+            _write_run_cache(_run_cache_path(self.cache_dir, self.client.base_url, dag_id, dag_run), response)
+    
+    def _split_by_run(
+        self,
+        dag_id: str,
+        dag_runs: List[DagRun],
+        cached: Dict[str, TaskInstancesResponse],
+        fetched: TaskInstancesResponse
+    ) -> List[TaskInstancesResponse]:
+        """
+        Line up task instances with dag_runs, one response per run.
+        
+        Runs in cached keep their cached response; batch-fetched task instances
+        are grouped by their dag_run_id, and those of finished runs are cached.
+        """
+        fetched_by_run: Dict[str, List[TaskInstance]] = {}
+        for task in fetched.task_instances:
+            fetched_by_run.setdefault(task.dag_run_id, []).append(task)
+        
+        task_data = []
+        for dag_run in dag_runs:
+            response = cached.get(dag_run.dag_run_id)
+            if response is None:
+                response = TaskInstancesResponse(task_instances=fetched_by_run.get(dag_run.dag_run_id, []))
+                self._store_task_instances(dag_id, dag_run, response)
+            task_data.append(response)
+        return task_data
+    
+    @staticmethod
+    def _found_dag_runs(dag_runs: List[DagRun]) -> bool:
+        """Report how many DAG runs were found; False when there are none."""
+        if not dag_runs:
+            logger.info("ℹ️  No DAG runs found in the specified time period")
+            return False
+        logger.info("✅ Found %d DAG runs", len(dag_runs))
+        return True
+    
+    @cache_to_parquet
     def fetch_task_data(
         self, 
         dag_id: str, 
         time_period: TimePeriod,
-        task_states: List[TaskState]
+        task_states: Collection[TaskState]
     ) -> pl.DataFrame:
         """
         Fetch and process task data for analysis.
@@ -146,79 +767,215 @@ class TaskDataFetcher:
             
         Returns:
             Polars DataFrame with task data
+            
+        Raises:
+            DAGMonitorError: If the DAG runs or task instances cannot be
+                fetched completely
         """
-        # Calculate time range
-        end_time = datetime.utcnow()
-        start_time = end_time - time_period.delta
-        start_date_str = start_time.isoformat() + "Z"
-        
-        print(f"📊 Fetching DAG runs from {start_date_str} to {end_time.isoformat()}Z")
+        start_date_str = self._start_date(time_period)
         
         # Get DAG runs
-        dag_runs_data = self.client.get_dag_runs(dag_id, start_date_str)
-        dag_runs = dag_runs_data.get("dag_runs", [])
-        
-        if not dag_runs:
-            print("ℹ️  No DAG runs found in the specified time period")
+        dag_runs = self.client.get_dag_runs(dag_id, start_date_str).dag_runs
+        if not self._found_dag_runs(dag_runs):
             return pl.DataFrame()
         
-        print(f"✅ Found {len(dag_runs)} DAG runs")
+        # Finished runs are served from the cache; the task instances of all
+        # other runs come from paged batch requests
+        cached, missing = self._cached_runs(dag_id, dag_runs)
+        with _task_instance_errors(len(missing)):
+            fetched = self.client.list_task_instances(dag_id, missing) if missing else TaskInstancesResponse()
+        task_data = self._split_by_run(dag_id, dag_runs, cached, fetched)
         
-        # Collect all task instances
-        all_tasks = []
-        state_filter = {state.value for state in task_states} if task_states else set()
+        return self._build_dataframe(dag_id, dag_runs, task_data, task_states)
+    
+    @cache_to_parquet
+    async def fetch_task_data_async(
+        self, 
+        dag_id: str, 
+        time_period: TimePeriod,
+        task_states: Collection[TaskState]
+    ) -> pl.DataFrame:
+        """
+        Fetch and process task data for analysis, issuing API requests concurrently.
         
-        for dag_run in dag_runs:
-            dag_run_id = dag_run["dag_run_id"]
-            run_type = dag_run["run_type"]
-            logical_date = dag_run["logical_date"]
-            dag_start_date = dag_run["start_date"]
-            dag_end_date = dag_run["end_date"]
-            dag_state = dag_run["state"]
+        Requires the fetcher to be constructed with an AsyncAirflowClient.
+        
+        Args:
+            dag_id: The DAG to analyze
+            time_period: Time period for data collection
+            task_states: List of task states to filter by
             
-            # Get task instances for this DAG run
-            task_data = self.client.get_task_instances(dag_id, dag_run_id)
-            task_instances = task_data.get("task_instances", [])
+        Returns:
+            Polars DataFrame with task data
             
+        Raises:
+            DAGMonitorError: If the DAG runs or task instances cannot be
+                fetched completely
+        """
+        start_date_str = self._start_date(time_period)
+        
+        async with self.client as client:
+            # Get DAG runs
+            dag_runs = (await client.get_dag_runs(dag_id, start_date_str)).dag_runs
+            if not self._found_dag_runs(dag_runs):
+                return pl.DataFrame()
+            
+            # Finished runs are served from the cache; the task instances of all
+            # other runs come from paged batch requests. The run cache is read
+            # and written in a worker thread to keep file I/O off the event loop.
+            cached, missing = await asyncio.to_thread(self._cached_runs, dag_id, dag_runs)
+            with _task_instance_errors(len(missing)):
+                fetched = await client.list_task_instances(dag_id, missing) if missing else TaskInstancesResponse()
+        
+        task_data = await asyncio.to_thread(self._split_by_run, dag_id, dag_runs, cached, fetched)
+        
+        return self._build_dataframe(dag_id, dag_runs, task_data, task_states)
+    
+    @staticmethod
+    def _build_dataframe(
+        dag_id: str,
+        dag_runs: List[DagRun],
+        task_data: List[TaskInstancesResponse],
+        task_states: Collection[TaskState]
+    ) -> pl.DataFrame:
+        """
+        Flatten DAG runs and their task instances into a task DataFrame.
+        
+        Args:
+            dag_id: The DAG the runs belong to
+            dag_runs: DAG run records from the API
+            task_data: Task instance responses, one per DAG run in the same order
+            task_states: List of task states to filter by
+            
+        Returns:
+            Polars DataFrame with task data
+        """
+        # Collect the matching task instances, and the DAG run fields column by
+        # column, repeated for every task collected from the run
+        tasks: List[TaskInstance] = []
+        dag_run_ids: List[str] = []
+        run_types: List[str] = []
+        logical_dates: List[Optional[str]] = []
+        dag_start_dates: List[Optional[str]] = []
+        dag_end_dates: List[Optional[str]] = []
+        dag_states: List[str] = []
+        # None when no states are given, so the per-task check is skipped entirely
+        state_filter = {state.value for state in task_states} if task_states else None
+        
+        for dag_run, run_task_data in zip(dag_runs, task_data):
             # Filter and collect tasks
-            for task in task_instances:
-                if not task_states or task["state"] in state_filter:
-                    all_tasks.append({
-                        "dag_id": dag_id,
-                        "dag_run_id": dag_run_id,
-                        "run_type": run_type,
-                        "logical_date": logical_date,
-                        "dag_start_date": dag_start_date,
-                        "dag_end_date": dag_end_date,
-                        "dag_state": dag_state,
-                        "task_id": task["task_id"],
-                        "task_state": task["state"],
-                        "task_start_date": task.get("start_date"),
-                        "task_end_date": task.get("end_date"),
-                        "duration": task.get("duration", 0.0),
-                        "try_number": task.get("try_number", 0),
-                        "max_tries": task.get("max_tries", 0),
-                        "operator": task.get("operator", ""),
-                        "priority_weight": task.get("priority_weight", 0)
-                    })
-        
-        if not all_tasks:
-            print("ℹ️  No matching tasks found")
-            return pl.DataFrame()
+            run_tasks = run_task_data.task_instances
+            if state_filter is not None:
+                run_tasks = [task for task in run_tasks if task.state in state_filter]
+            tasks.extend(run_tasks)
+            
+            run_task_count = len(run_tasks)
+            dag_run_ids.extend([dag_run.dag_run_id] * run_task_count)
+            run_types.extend([dag_run.run_type] * run_task_count)
+            logical_dates.extend([dag_run.logical_date] * run_task_count)
+            dag_start_dates.extend([dag_run.start_date] * run_task_count)
+            dag_end_dates.extend([dag_run.end_date] * run_task_count)
+            dag_states.extend([dag_run.state] * run_task_count)
         
-        # Convert to Polars DataFrame
-        df = pl.DataFrame(all_tasks)
+        if not tasks:
+            logger.info("ℹ️  No matching tasks found")
+            return pl.DataFrame()
         
-        # Convert datetime columns
+        # Convert to Polars DataFrame; task fields are read one column at a
+        # time, a tight comprehension per field rather than nine appends per task.
+        # The date and duration columns have declared types, since a column
+        # that is all None (e.g. end dates and durations while every run is
+        # still running) would otherwise be inferred as Null, which the
+        # datetime parse rejects.
         datetime_cols = ["logical_date", "dag_start_date", "dag_end_date", "task_start_date", "task_end_date"]
-        for col in datetime_cols:
-            if col in df.columns:
-                df = df.with_columns(pl.col(col).str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%S%.fZ", strict=False))
+        df = pl.DataFrame({
+            "dag_id": [dag_id] * len(tasks),
+            "dag_run_id": dag_run_ids,
+            "run_type": run_types,
+            "logical_date": logical_dates,
+            "dag_start_date": dag_start_dates,
+            "dag_end_date": dag_end_dates,
+            "dag_state": dag_states,
+            "task_id": [task.task_id for task in tasks],
+            "task_state": [task.state for task in tasks],
+            "task_start_date": [task.start_date for task in tasks],
+            "task_end_date": [task.end_date for task in tasks],
+            "duration": [task.duration for task in tasks],
+            "try_number": [task.try_number for task in tasks],
+            "max_tries": [task.max_tries for task in tasks],
+            "operator": [task.operator for task in tasks],
+            "priority_weight": [task.priority_weight for task in tasks]
+        }, schema_overrides={**{col: pl.String for col in datetime_cols}, "duration": pl.Float64})
         
-        print(f"✅ Collected {len(df)} task instances")
+        # Store the low-cardinality state columns as categoricals and parse the
+        # datetime columns, all in one pass over the frame. "%+" is Polars'
+        # RFC 3339 fast path and accepts both "Z" and "+00:00" suffixes; the
+        # parsed UTC values are kept as naive datetimes. Unfiltered data can hold
+        # states TaskState does not list (e.g. from a newer Airflow); those
+        # become null rather than failing the cast.
+        df = df.with_columns([
+            pl.col("task_state").cast(TASK_STATE_DTYPE, strict=False),
+            pl.col("run_type").cast(pl.Categorical),
+            pl.col(datetime_cols).str.to_datetime("%+", time_unit="us", strict=False).dt.replace_time_zone(None)
+        ])
+        
+        logger.info("✅ Collected %d task instances", len(df))
         return df
 
 
+class TaskStatistics(NamedTuple):
+    """Basic statistics over a task DataFrame"""
+    total_tasks: int
+    unique_dag_runs: int
+    unique_task_types: int
+    state_breakdown: pl.DataFrame
+    
+    @classmethod
+    def from_frames(cls, totals: pl.DataFrame, state_breakdown: pl.DataFrame) -> "TaskStatistics":
+        """
+        Package the collected results of TaskAnalyzer.get_basic_statistics_lazy.
+        
+        Args:
+            totals: Single-row frame of scalar totals
+            state_breakdown: Task count per state
+            
+        Returns:
+            TaskStatistics instance
+        """
+        return cls(**totals.row(0, named=True), state_breakdown=state_breakdown)
+
+
+# TaskAnalyzer aggregations, built once at import; Polars expressions are
+# immutable and can be reused by every query
+_SUCCESS = pl.lit(TaskState.SUCCESS.value, dtype=TASK_STATE_DTYPE)
+_FAILED = pl.lit(TaskState.FAILED.value, dtype=TASK_STATE_DTYPE)
+_SKIPPED = pl.lit(TaskState.SKIPPED.value, dtype=TASK_STATE_DTYPE)
+
+_NO_SKIPPED_AGG = (
+    pl.lit(2, dtype=pl.UInt32).pow(pl.col("task_state").to_physical())
+        .cast(pl.UInt32).bitwise_or().fill_null(0).alias("state_mask"),
+    pl.col("task_state").eq(_SUCCESS).sum().alias("success_count"),
+    pl.col("task_state").eq(_FAILED).sum().alias("failed_count"),
+    pl.len().alias("total_tasks"),
+    pl.col("logical_date").first().alias("logical_date"),
+    pl.col("run_type").first().alias("run_type"),
+    pl.col("dag_state").first().alias("dag_state"),
+    pl.col("duration").sum().alias("total_duration")
+)
+_NO_SKIPPED_FILTER = (pl.col("state_mask") & state_bit(TaskState.SKIPPED)) == 0
+
+_RUN_SUMMARY_AGG = (
+    pl.col("run_type").first(),
+    pl.col("logical_date").first(),
+    pl.col("dag_state").first(),
+    pl.col("task_state").eq(_SUCCESS).sum().alias("success_tasks"),
+    pl.col("task_state").eq(_FAILED).sum().alias("failed_tasks"),
+    pl.col("task_state").eq(_SKIPPED).sum().alias("skipped_tasks"),
+    pl.len().alias("total_tasks"),
+    pl.col("duration").sum().alias("total_duration")
+)
+
+
 class TaskAnalyzer:
     """
     Analyzer for processing task data and generating insights.
@@ -226,7 +983,31 @@ class TaskAnalyzer:
     """
     
     @staticmethod
-    def get_basic_statistics(df: pl.DataFrame) -> Dict[str, Any]:
+    def get_basic_statistics_lazy(lf: pl.LazyFrame) -> Tuple[pl.LazyFrame, pl.LazyFrame]:
+        """
+        Build lazy queries for the basic task statistics.
+        
+        Args:
+            lf: LazyFrame with task data
+            
+        Returns:
+            Tuple of (totals, state breakdown) LazyFrames, meant to be
+            collected together with pl.collect_all
+        """
+        totals = lf.select([
+            pl.len().alias("total_tasks"),
+            pl.col("dag_run_id").n_unique().alias("unique_dag_runs"),
+            pl.col("task_id").n_unique().alias("unique_task_types")
+        ])
+        # value_counts is a dedicated single-pass counting kernel, already sorted
+        state_summary = lf.select(
+            pl.col("task_state").value_counts(sort=True, name="count")
+        ).unnest("task_state")
+        
+        return totals, state_summary
+    
+    @staticmethod
+    def get_basic_statistics(df: pl.DataFrame) -> Optional[TaskStatistics]:
         """
         Calculate basic statistics from task data.
         
@@ -234,23 +1015,32 @@ class TaskAnalyzer:
             df: DataFrame with task data
             
         Returns:
-            Dictionary with basic statistics
+            TaskStatistics, or None if there is no data
         """
         if df.is_empty():
-            return {}
+            return None
+        
+        return TaskStatistics.from_frames(*pl.collect_all(TaskAnalyzer.get_basic_statistics_lazy(df.lazy())))
+    
+    @staticmethod
+    def find_runs_without_skipped_tasks_lazy(lf: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Build a lazy query for DAG runs that have zero skipped tasks.
         
-        total_tasks = len(df)
-        unique_dag_runs = df["dag_run_id"].n_unique()
-        unique_task_types = df["task_id"].n_unique()
+        Args:
+            lf: LazyFrame with task data
+            
+        Returns:
+            LazyFrame with DAG runs that have no skipped tasks
+        """
+        # Group by DAG run, OR-ing one bit per observed state into a mask and
+        # counting states as boolean sums in the same pass
+        run_stats = lf.group_by("dag_run_id").agg(_NO_SKIPPED_AGG)
         
-        state_summary = df.group_by("task_state").agg(pl.count().alias("count")).sort("count", descending=True)
+        # Keep runs whose mask has no skipped bit
+        no_skipped_runs = run_stats.filter(_NO_SKIPPED_FILTER).drop("state_mask")
         
-        return {
-            "total_tasks": total_tasks,
-            "unique_dag_runs": unique_dag_runs,
-            "unique_task_types": unique_task_types,
-            "state_breakdown": state_summary.to_dicts()
-        }
+        return no_skipped_runs.sort("logical_date", descending=True)
     
     @staticmethod
     def find_runs_without_skipped_tasks(df: pl.DataFrame) -> pl.DataFrame:
@@ -266,22 +1056,22 @@ class TaskAnalyzer:
         if df.is_empty():
             return pl.DataFrame()
         
-        # Group by DAG run and count task states
-        run_stats = df.group_by("dag_run_id").agg([
-            pl.col("task_state").filter(pl.col("task_state") == "skipped").count().alias("skipped_count"),
-            pl.col("task_state").filter(pl.col("task_state") == "success").count().alias("success_count"),
-            pl.col("task_state").filter(pl.col("task_state") == "failed").count().alias("failed_count"),
-            pl.col("task_state").count().alias("total_tasks"),
-            pl.col("logical_date").first().alias("logical_date"),
-            pl.col("run_type").first().alias("run_type"),
-            pl.col("dag_state").first().alias("dag_state"),
-            pl.col("duration").sum().alias("total_duration")
-        ])
-        
-        # Filter runs with zero skipped tasks
-        no_skipped_runs = run_stats.filter(pl.col("skipped_count") == 0)
+        return TaskAnalyzer.find_runs_without_skipped_tasks_lazy(df.lazy()).collect()
+    
+    @staticmethod
+    def create_dag_run_summary_lazy(lf: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Build a lazy query summarizing each DAG run.
         
-        return no_skipped_runs.sort("logical_date", descending=True)
+        Args:
+            lf: LazyFrame with task data
+            
+        Returns:
+            LazyFrame with DAG run summaries
+        """
+        # One hash pass keyed on the run alone; the run attributes are the
+        # same for every task in a run, and states are counted as boolean sums
+        return lf.group_by("dag_run_id").agg(_RUN_SUMMARY_AGG).sort("logical_date", descending=True)
     
     @staticmethod
     def create_dag_run_summary(df: pl.DataFrame) -> pl.DataFrame:
@@ -296,40 +1086,37 @@ class TaskAnalyzer:
         """
         if df.is_empty():
             return pl.DataFrame()
-            
-        summary = df.group_by(["dag_run_id", "run_type", "logical_date", "dag_state"]).agg([
-            pl.col("task_state").filter(pl.col("task_state") == "success").count().alias("success_tasks"),
-            pl.col("task_state").filter(pl.col("task_state") == "failed").count().alias("failed_tasks"),
-            pl.col("task_state").filter(pl.col("task_state") == "skipped").count().alias("skipped_tasks"),
-            pl.col("task_state").count().alias("total_tasks"),
-            pl.col("duration").sum().alias("total_duration")
-        ]).sort("logical_date", descending=True)
         
-        return summary
+        return TaskAnalyzer.create_dag_run_summary_lazy(df.lazy()).collect()
 
 
-def display_statistics(stats: Dict[str, Any]) -> None:
+def display_statistics(stats: Optional[TaskStatistics]) -> None:
     """
     Display basic statistics in a formatted way.
     
     Args:
-        stats: Statistics dictionary from TaskAnalyzer
+        stats: Statistics from TaskAnalyzer
     """
-    if not stats:
+    if stats is None:
         print("ℹ️  No statistics available")
         return
     
-    print("\n" + "="*60)
-    print("📈 TASK EXECUTION STATISTICS")
-    print("="*60)
-    print(f"Total Task Instances: {stats['total_tasks']:,}")
-    print(f"Unique DAG Runs: {stats['unique_dag_runs']:,}")
-    print(f"Unique Task Types: {stats['unique_task_types']:,}")
+    lines = [
+        "",
+        _SEP,
+        "📈 TASK EXECUTION STATISTICS",
+        _SEP,
+        f"Total Task Instances: {stats.total_tasks:,}",
+        f"Unique DAG Runs: {stats.unique_dag_runs:,}",
+        f"Unique Task Types: {stats.unique_task_types:,}",
+        "",
+        "📊 Task State Breakdown:"
+    ]
+    for state_info in stats.state_breakdown.iter_rows(named=True):
+        percentage = (state_info['count'] / stats.total_tasks) * 100
+        lines.append(f"  • {state_info['task_state'].upper()}: {state_info['count']:,} ({percentage:.1f}%)")
     
-    print(f"\n📊 Task State Breakdown:")
-    for state_info in stats['state_breakdown']:
-        percentage = (state_info['count'] / stats['total_tasks']) * 100
-        print(f"  • {state_info['task_state'].upper()}: {state_info['count']:,} ({percentage:.1f}%)")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_no_skipped_analysis(no_skipped_df: pl.DataFrame) -> None:
@@ -339,39 +1126,81 @@ def display_no_skipped_analysis(no_skipped_df: pl.DataFrame) -> None:
     Args:
         no_skipped_df: DataFrame with DAG runs that have no skipped tasks
     """
-    print("\n" + "="*60)
-    print("🎯 DAG RUNS WITH ZERO SKIPPED TASKS")
-    print("="*60)
+    lines = ["", _SEP, "🎯 DAG RUNS WITH ZERO SKIPPED TASKS", _SEP]
     
     if no_skipped_df.is_empty():
-        print("❌ No DAG runs found with zero skipped tasks in the specified time period")
+        lines.append("❌ No DAG runs found with zero skipped tasks in the specified time period")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
-    print(f"✅ Found {len(no_skipped_df)} DAG runs with no skipped tasks:\n")
+    lines.append(f"✅ Found {len(no_skipped_df)} DAG runs with no skipped tasks:\n")
     
     for row in no_skipped_df.iter_rows(named=True):
         success_rate = (row['success_count'] / row['total_tasks']) * 100 if row['total_tasks'] > 0 else 0
         
-        print(f"🔹 {row['dag_run_id']}")
-        print(f"   Success: {row['success_count']}/{row['total_tasks']} tasks ({success_rate:.1f}%)")
-        print(f"   Failed: {row['failed_count']} tasks")
-        print(f"   Total Duration: {row['total_duration']:.2f}s")
-        print(f"   Run Type: {row['run_type']}")
-        print(f"   Logical Date: {row['logical_date']}")
-        print()
+        lines.extend([
+            f"🔹 {row['dag_run_id']}",
+            f"   Success: {row['success_count']}/{row['total_tasks']} tasks ({success_rate:.1f}%)",
+            f"   Failed: {row['failed_count']} tasks",
+            f"   Total Duration: {row['total_duration']:.2f}s",
+            f"   Run Type: {row['run_type']}",
+            f"   Logical Date: {row['logical_date']}",
+            ""
+        ])
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def save_task_data(df: pl.DataFrame, output_dir: str, dag_id: str, output_format: str = "csv") -> str:
+    """
+    Save task data to a file in the output directory.
+    
+    Args:
+        df: DataFrame with task data
+        output_dir: Directory to write the file to
+        dag_id: DAG ID used to name the file
+        output_format: "csv", "csv.zst" (zstd-compressed CSV) or "parquet"
+            (zstd-compressed)
+    
+    Returns:
+        Path of the written file
+        
+    Raises:
+        ValueError: If output_format is not supported
+    """
+    if output_format == "csv":
+        output_file = os.path.join(output_dir, f"{dag_id}_tasks.csv")
+        df.write_csv(output_file, batch_size=65536)
+    elif output_format == "csv.zst":
+        output_file = os.path.join(output_dir, f"{dag_id}_tasks.csv.zst")
+        with zstandard.open(output_file, "wb") as f:
+            df.write_csv(f, batch_size=65536)
+    elif output_format == "parquet":
+        output_file = os.path.join(output_dir, f"{dag_id}_tasks.parquet")
+        df.write_parquet(output_file, compression="zstd", use_pyarrow=False)
+    else:
+        raise ValueError(f"Invalid OUTPUT_FORMAT '{output_format}'. Valid options: ['csv', 'csv.zst', 'parquet']")
+    
+    logger.info("💾 Saved %d task instances to %s", len(df), output_file)
+    return output_file
 
 
-def validate_configuration(dag_id: str, time_period_str: str, task_states_list: Optional[List[str]] = None) -> tuple:
+def validate_configuration(
+    dag_id: str,
+    time_period_str: str,
+    task_states_list: Optional[Union[Iterable[str], FrozenSet[TaskState]]] = None
+) -> Tuple[TimePeriod, FrozenSet[TaskState]]:
     """
     Validate configuration parameters and return parsed values.
     
     Args:
         dag_id: DAG ID to validate
         time_period_str: Time period string to validate
-        task_states_list: List of task state strings to validate
+        task_states_list: Task state strings to validate, or a frozenset of
+            TaskState members that has already been normalized
     
     Returns:
-        Tuple of (time_period, task_states) objects
+        Tuple of (time_period, task_states), task_states as a frozenset
         
     Raises:
         ValueError: If any configuration parameter is invalid
@@ -380,25 +1209,22 @@ def validate_configuration(dag_id: str, time_period_str: str, task_states_list:
         raise ValueError("DAG_ID is required and cannot be empty")
     
     # Validate TIME_PERIOD
-    time_period = None
-    for period in TimePeriod:
-        if period.label == time_period_str:
-            time_period = period
-            break
-    
+    time_period = _PERIODS_BY_LABEL.get(time_period_str)
     if time_period is None:
-        valid_periods = [period.label for period in TimePeriod]
+        valid_periods = list(_PERIODS_BY_LABEL)
         raise ValueError(f"Invalid TIME_PERIOD '{time_period_str}'. Valid options: {valid_periods}")
     
     # Validate TASK_STATES
+    if task_states_list is None:
+        return time_period, frozenset(TaskState)  # All states
+    if isinstance(task_states_list, frozenset) and all(isinstance(state, TaskState) for state in task_states_list):
+        return time_period, task_states_list  # Already normalized
+    
     task_states = []
-    if task_states_list is not None:
-        valid_states = [state.value for state in TaskState]
-        for state in task_states_list:
-            if state not in valid_states:
-                raise ValueError(f"Invalid task state '{state}'. Valid options: {valid_states}")
-            task_states.append(TaskState(state))
-    else:
-        task_states = list(TaskState)  # All states
+    for state in task_states_list:
+        if state not in _VALID_STATE_VALUES:
+            valid_states = [member.value for member in TaskState]
+            raise ValueError(f"Invalid task state '{state}'. Valid options: {valid_states}")
+        task_states.append(TaskState(state))
     
-    return time_period, task_states
\ No newline at end of file
+    return time_period, frozenset(task_states)